@@ -0,0 +1,91 @@
+"""partition orders by month
+
+Revision ID: 0fd5a7733edf
+Revises: 04cd1f6d4542
+Create Date: 2026-10-19 09:12:40.118240
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0fd5a7733edf'
+down_revision: Union[str, None] = '04cd1f6d4542'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months of empty partitions created ahead of the current month
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_month_partition(month: date) -> None:
+    upper = _add_months(month, 1)
+    op.execute(
+        f"CREATE TABLE IF NOT EXISTS orders_y{month.year}m{month.month:02d} "
+        f"PARTITION OF orders FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+        f"TO ('{upper.isoformat()} 00:00:00+00')"
+    )
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # Foreign keys to a partitioned table must cover the partition key, so the
+    # order_items -> orders link is kept as a plain indexed column.
+    op.drop_constraint('order_items_order_id_fkey', 'order_items', type_='foreignkey')
+    op.create_index(op.f('ix_order_items_order_id'), 'order_items', ['order_id'], unique=False)
+
+    op.rename_table('orders', 'orders_unpartitioned')
+    op.execute('ALTER TABLE orders_unpartitioned RENAME CONSTRAINT orders_pkey TO orders_unpartitioned_pkey')
+    op.execute('ALTER INDEX ix_orders_id RENAME TO ix_orders_unpartitioned_id')
+
+    op.execute(
+        'CREATE TABLE orders (LIKE orders_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        'PARTITION BY RANGE (created_datetime)'
+    )
+    op.create_primary_key('orders_pkey', 'orders', ['id', 'created_datetime'])
+    op.create_index(op.f('ix_orders_id'), 'orders', ['id'], unique=False)
+    op.create_index(op.f('ix_orders_created_datetime'), 'orders', ['created_datetime'], unique=False)
+
+    first = conn.execute(sa.text(
+        "SELECT date_trunc('month', min(created_datetime) AT TIME ZONE 'UTC')::date FROM orders_unpartitioned"
+    )).scalar()
+    current = date.today().replace(day=1)
+    month = min(first, current) if first else current
+    last = _add_months(current, MONTHS_AHEAD)
+    while month <= last:
+        _create_month_partition(month)
+        month = _add_months(month, 1)
+
+    # Catches rows outside the pre-created range until maintenance adds a partition
+    op.execute('CREATE TABLE orders_default PARTITION OF orders DEFAULT')
+
+    op.execute('INSERT INTO orders SELECT * FROM orders_unpartitioned')
+    op.drop_table('orders_unpartitioned')
+
+
+def downgrade() -> None:
+    op.rename_table('orders', 'orders_partitioned')
+    op.execute('ALTER TABLE orders_partitioned RENAME CONSTRAINT orders_pkey TO orders_partitioned_pkey')
+    op.execute('ALTER INDEX ix_orders_id RENAME TO ix_orders_partitioned_id')
+    op.execute('ALTER INDEX ix_orders_created_datetime RENAME TO ix_orders_partitioned_created_datetime')
+
+    op.execute('CREATE TABLE orders (LIKE orders_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    op.create_primary_key('orders_pkey', 'orders', ['id'])
+    op.create_index(op.f('ix_orders_id'), 'orders', ['id'], unique=False)
+    op.execute('INSERT INTO orders SELECT * FROM orders_partitioned')
+
+    # Drops the parent together with every attached partition
+    op.execute('DROP TABLE orders_partitioned CASCADE')
+
+    op.drop_index(op.f('ix_order_items_order_id'), table_name='order_items')
+    op.create_foreign_key('order_items_order_id_fkey', 'order_items', 'orders', ['order_id'], ['id'])
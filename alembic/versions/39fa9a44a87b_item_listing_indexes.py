@@ -0,0 +1,34 @@
+"""item listing indexes
+
+Revision ID: 39fa9a44a87b
+Revises: d13cab6eaa3e
+Create Date: 2026-10-19 17:05:37.180425
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '39fa9a44a87b'
+down_revision: Union[str, None] = 'd13cab6eaa3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_items_newest', 'items', ['created_datetime', 'id'], unique=False)
+    op.create_index('ix_items_category_newest', 'items', ['category_id', 'created_datetime', 'id'], unique=False)
+    op.create_index('ix_items_price', 'items', [sa.text('coalesce(final_price, item_price)'), 'id'], unique=False)
+    op.create_index('ix_items_category_price', 'items', ['category_id', sa.text('coalesce(final_price, item_price)'), 'id'], unique=False)
+    op.create_index('ix_items_discount', 'items', [sa.text('coalesce(discount, 0)'), 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_items_discount', table_name='items')
+    op.drop_index('ix_items_category_price', table_name='items')
+    op.drop_index('ix_items_price', table_name='items')
+    op.drop_index('ix_items_category_newest', table_name='items')
+    op.drop_index('ix_items_newest', table_name='items')
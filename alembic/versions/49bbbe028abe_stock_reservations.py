@@ -0,0 +1,69 @@
+"""stock reservations
+
+Revision ID: 49bbbe028abe
+Revises: 0fd5a7733edf
+Create Date: 2026-10-19 10:02:17.530981
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '49bbbe028abe'
+down_revision: Union[str, None] = '0fd5a7733edf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('items', sa.Column('reservation_slots', sa.Integer(), server_default=sa.text('0'), nullable=False))
+
+    op.create_table('item_stock_slots',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('item_id', sa.String(), nullable=False),
+    sa.Column('slot_no', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('updated_datetime', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('item_id', 'slot_no', name='uq_item_stock_slots_item_slot')
+    )
+    op.create_index(op.f('ix_item_stock_slots_id'), 'item_stock_slots', ['id'], unique=False)
+    op.create_index(op.f('ix_item_stock_slots_item_id'), 'item_stock_slots', ['item_id'], unique=False)
+
+    op.create_table('stock_reservations',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('item_id', sa.String(), nullable=False),
+    sa.Column('slot_id', sa.String(), nullable=True),
+    sa.Column('order_id', sa.String(), nullable=True),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('held', 'committed', 'settled', 'released', name='reservationstatus'), nullable=False),
+    sa.Column('expires_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('created_datetime', sa.TIMESTAMP(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_datetime', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['slot_id'], ['item_stock_slots.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_stock_reservations_id'), 'stock_reservations', ['id'], unique=False)
+    op.create_index(op.f('ix_stock_reservations_item_id'), 'stock_reservations', ['item_id'], unique=False)
+    op.create_index(op.f('ix_stock_reservations_order_id'), 'stock_reservations', ['order_id'], unique=False)
+    op.create_index('ix_stock_reservations_status_expires_at', 'stock_reservations', ['status', 'expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_stock_reservations_status_expires_at', table_name='stock_reservations')
+    op.drop_index(op.f('ix_stock_reservations_order_id'), table_name='stock_reservations')
+    op.drop_index(op.f('ix_stock_reservations_item_id'), table_name='stock_reservations')
+    op.drop_index(op.f('ix_stock_reservations_id'), table_name='stock_reservations')
+    op.drop_table('stock_reservations')
+    sa.Enum(name='reservationstatus').drop(op.get_bind(), checkfirst=True)
+
+    op.drop_index(op.f('ix_item_stock_slots_item_id'), table_name='item_stock_slots')
+    op.drop_index(op.f('ix_item_stock_slots_id'), table_name='item_stock_slots')
+    op.drop_table('item_stock_slots')
+
+    op.drop_column('items', 'reservation_slots')
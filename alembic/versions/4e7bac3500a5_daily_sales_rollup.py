@@ -0,0 +1,35 @@
+"""daily sales rollup
+
+Revision ID: 4e7bac3500a5
+Revises: 49bbbe028abe
+Create Date: 2026-10-19 11:20:05.671402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e7bac3500a5'
+down_revision: Union[str, None] = '49bbbe028abe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('daily_sales_rollup',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('channel', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Float(), nullable=False),
+    sa.Column('updated_datetime', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'channel', 'status')
+    )
+    # Populate with: python -m scripts.sales_rollup rebuild
+
+
+def downgrade() -> None:
+    op.drop_table('daily_sales_rollup')
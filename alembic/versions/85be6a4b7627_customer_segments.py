@@ -0,0 +1,43 @@
+"""customer segments
+
+Revision ID: 85be6a4b7627
+Revises: af6b9c0a617e
+Create Date: 2026-10-19 15:52:13.640981
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '85be6a4b7627'
+down_revision: Union[str, None] = 'af6b9c0a617e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('customer_segments',
+    sa.Column('customer_id', sa.String(), nullable=False),
+    sa.Column('customer_type', sa.String(), nullable=False),
+    sa.Column('recency_days', sa.Integer(), nullable=False),
+    sa.Column('frequency', sa.Integer(), nullable=False),
+    sa.Column('monetary', sa.Float(), nullable=False),
+    sa.Column('r_score', sa.Integer(), nullable=False),
+    sa.Column('f_score', sa.Integer(), nullable=False),
+    sa.Column('m_score', sa.Integer(), nullable=False),
+    sa.Column('segment', sa.String(), nullable=False),
+    sa.Column('computed_datetime', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('customer_id')
+    )
+    op.create_index('ix_customer_segments_monetary', 'customer_segments', ['monetary', 'customer_id'], unique=False)
+    op.create_index('ix_customer_segments_segment_monetary', 'customer_segments', ['segment', 'monetary', 'customer_id'], unique=False)
+    # Populate with: python -m scripts.customer_segments run
+
+
+def downgrade() -> None:
+    op.drop_index('ix_customer_segments_segment_monetary', table_name='customer_segments')
+    op.drop_index('ix_customer_segments_monetary', table_name='customer_segments')
+    op.drop_table('customer_segments')
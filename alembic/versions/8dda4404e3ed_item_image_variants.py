@@ -0,0 +1,26 @@
+"""item image variants
+
+Revision ID: 8dda4404e3ed
+Revises: aeaa0cdaa09e
+Create Date: 2026-10-19 19:20:48.331907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8dda4404e3ed'
+down_revision: Union[str, None] = 'aeaa0cdaa09e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('items', sa.Column('image_variants', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('items', 'image_variants')
@@ -0,0 +1,26 @@
+"""item freshness index
+
+Revision ID: aeaa0cdaa09e
+Revises: 860119faf6ed
+Create Date: 2026-10-19 18:42:10.514203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'aeaa0cdaa09e'
+down_revision: Union[str, None] = '860119faf6ed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_items_category_updated', 'items', ['category_id', 'updated_datetime'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_items_category_updated', table_name='items')
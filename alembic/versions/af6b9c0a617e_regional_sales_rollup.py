@@ -0,0 +1,38 @@
+"""regional sales rollup
+
+Revision ID: af6b9c0a617e
+Revises: f8b7d4b2ee40
+Create Date: 2026-10-19 15:20:44.902176
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'af6b9c0a617e'
+down_revision: Union[str, None] = 'f8b7d4b2ee40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('regional_sales_rollup',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('state', sa.String(), nullable=False),
+    sa.Column('city', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Float(), nullable=False),
+    sa.Column('updated_datetime', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'state', 'city', 'status')
+    )
+    op.create_index('ix_regional_sales_rollup_state_day', 'regional_sales_rollup', ['state', 'day'], unique=False)
+    # Populate with: python -m scripts.sales_rollup rebuild-regions
+
+
+def downgrade() -> None:
+    op.drop_index('ix_regional_sales_rollup_state_day', table_name='regional_sales_rollup')
+    op.drop_table('regional_sales_rollup')
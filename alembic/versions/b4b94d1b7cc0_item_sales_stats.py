@@ -0,0 +1,36 @@
+"""item sales stats
+
+Revision ID: b4b94d1b7cc0
+Revises: 4e7bac3500a5
+Create Date: 2026-10-19 13:02:41.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4b94d1b7cc0'
+down_revision: Union[str, None] = '4e7bac3500a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('item_sales_stats',
+    sa.Column('item_id', sa.String(), nullable=False),
+    sa.Column('item_name', sa.String(), nullable=True),
+    sa.Column('units_sold', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Float(), nullable=False),
+    sa.Column('updated_datetime', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('item_id')
+    )
+    op.create_index('ix_item_sales_stats_units_sold', 'item_sales_stats', ['units_sold', 'revenue'], unique=False)
+    # Populate with: python -m scripts.sales_rollup rebuild-items
+
+
+def downgrade() -> None:
+    op.drop_index('ix_item_sales_stats_units_sold', table_name='item_sales_stats')
+    op.drop_table('item_sales_stats')
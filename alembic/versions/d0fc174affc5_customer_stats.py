@@ -0,0 +1,40 @@
+"""customer stats
+
+Revision ID: d0fc174affc5
+Revises: b4b94d1b7cc0
+Create Date: 2026-10-19 14:11:27.503318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0fc174affc5'
+down_revision: Union[str, None] = 'b4b94d1b7cc0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('customer_stats',
+    sa.Column('customer_id', sa.String(), nullable=False),
+    sa.Column('customer_type', sa.String(), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('lifetime_value', sa.Float(), nullable=False),
+    sa.Column('return_count', sa.Integer(), nullable=False),
+    sa.Column('last_order_datetime', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('updated_datetime', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('customer_id')
+    )
+    op.create_index('ix_customer_stats_lifetime_value', 'customer_stats', ['lifetime_value'], unique=False)
+    op.create_index('ix_customer_stats_order_count', 'customer_stats', ['order_count'], unique=False)
+    # Populate with: python -m scripts.sales_rollup rebuild-customers
+
+
+def downgrade() -> None:
+    op.drop_index('ix_customer_stats_order_count', table_name='customer_stats')
+    op.drop_index('ix_customer_stats_lifetime_value', table_name='customer_stats')
+    op.drop_table('customer_stats')
@@ -0,0 +1,45 @@
+"""report jobs
+
+Revision ID: d13cab6eaa3e
+Revises: 85be6a4b7627
+Create Date: 2026-10-19 16:31:52.774390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd13cab6eaa3e'
+down_revision: Union[str, None] = '85be6a4b7627'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('report_jobs',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('report_type', sa.String(), nullable=False),
+    sa.Column('format', sa.String(), nullable=False),
+    sa.Column('params', sa.JSON(), nullable=True),
+    sa.Column('status', sa.Enum('queued', 'running', 'completed', 'failed', name='reportjobstatus'), nullable=False),
+    sa.Column('requested_by', sa.String(), nullable=True),
+    sa.Column('file_path', sa.String(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_datetime', sa.TIMESTAMP(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('started_datetime', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('finished_datetime', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('updated_datetime', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_report_jobs_id'), 'report_jobs', ['id'], unique=False)
+    op.create_index('ix_report_jobs_status_created', 'report_jobs', ['status', 'created_datetime'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_report_jobs_status_created', table_name='report_jobs')
+    op.drop_index(op.f('ix_report_jobs_id'), table_name='report_jobs')
+    op.drop_table('report_jobs')
+    sa.Enum(name='reportjobstatus').drop(op.get_bind(), checkfirst=True)
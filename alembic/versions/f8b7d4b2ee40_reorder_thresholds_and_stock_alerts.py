@@ -0,0 +1,58 @@
+"""reorder thresholds and stock alerts
+
+Revision ID: f8b7d4b2ee40
+Revises: d0fc174affc5
+Create Date: 2026-10-19 14:48:09.117260
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8b7d4b2ee40'
+down_revision: Union[str, None] = 'd0fc174affc5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('items', sa.Column('reorder_threshold', sa.Integer(), server_default=sa.text('5'), nullable=False))
+    op.create_index('ix_items_low_stock', 'items', ['quantity'], unique=False,
+                    postgresql_where=sa.text('quantity <= reorder_threshold'))
+
+    op.create_table('stock_alerts',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('item_id', sa.String(), nullable=False),
+    sa.Column('item_name', sa.String(), nullable=True),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('threshold', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('open', 'resolved', name='stockalertstatus'), nullable=False),
+    sa.Column('created_datetime', sa.TIMESTAMP(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('resolved_datetime', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_stock_alerts_id'), 'stock_alerts', ['id'], unique=False)
+    op.create_index(op.f('ix_stock_alerts_item_id'), 'stock_alerts', ['item_id'], unique=False)
+    op.create_index('uq_stock_alerts_open_item', 'stock_alerts', ['item_id'], unique=True,
+                    postgresql_where=sa.text("status = 'open'"))
+
+    # Items already at or below the default threshold start with an open alert
+    op.execute("""
+        INSERT INTO stock_alerts (id, item_id, item_name, quantity, threshold, status)
+        SELECT gen_random_uuid()::text, id, item_name, quantity, reorder_threshold, 'open'
+        FROM items WHERE quantity <= reorder_threshold
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_stock_alerts_open_item', table_name='stock_alerts')
+    op.drop_index(op.f('ix_stock_alerts_item_id'), table_name='stock_alerts')
+    op.drop_index(op.f('ix_stock_alerts_id'), table_name='stock_alerts')
+    op.drop_table('stock_alerts')
+    sa.Enum(name='stockalertstatus').drop(op.get_bind(), checkfirst=True)
+    op.drop_index('ix_items_low_stock', table_name='items')
+    op.drop_column('items', 'reorder_threshold')
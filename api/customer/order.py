@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException,  status
 from sqlalchemy.orm import Session
-from fastapi import Body
-from typing import List
+from fastapi import Body, Query
+from typing import List, Optional, Union
 from config.db.session import get_db
-from schema.customer.order import CreateOrderRequest, OrderResponse, UpdateOrderStatusRequest, OrderStatus, OrderQueryRequest, OrderReasonUpdate
+from schema.customer.order import CreateOrderRequest, OrderResponse, UpdateOrderStatusRequest, OrderStatus, OrderQueryRequest, OrderReasonUpdate, OrderSummaryResponse, OrderView
 from service.customer.order import create_order, update_order_status_service, get_all_orders_service, get_orders_by_status_service, get_orders_by_user_or_guest, get_order_by_id, get_orders_by_user_or_guest_service, update_order_reason
+from schema.vendor.stock_reservation import ReserveStockRequest, ReleaseReservationsRequest, ReservationResponse
+from service.vendor.stock_reservation_service import reserve_items, release_reservations
 from utils.jwt_handler import get_current_vendor
 
 order_router = APIRouter()
@@ -23,6 +25,26 @@ def place_order(
         # catch & wrap unexpected errors
         raise HTTPException(status_code=500, detail=str(e))
 
+@order_router.post("/orders/reservations", response_model=ReservationResponse)
+def reserve_checkout_stock(
+    request: ReserveStockRequest = Body(...),
+    db: Session = Depends(get_db),
+):
+    """
+    Called when checkout starts. Holds stock for flash-sale items until
+    `expires_at`; pass the returned ids as `reservation_ids` when placing the order.
+    """
+    return reserve_items(db, request)
+
+
+@order_router.post("/orders/reservations/release", response_model=dict)
+def release_checkout_stock(
+    request: ReleaseReservationsRequest = Body(...),
+    db: Session = Depends(get_db),
+):
+    released = release_reservations(db, request.reservation_ids)
+    return {"released": released}
+
 @order_router.put("/orders/{order_id}/status", response_model=dict)
 def update_order_status(
     order_id: str,
@@ -45,19 +67,30 @@ def get_all_orders(db: Session = Depends(get_db)):
     orders = get_all_orders_service(db)
     return orders
 
-@order_router.get("/orders/status/{status}", response_model=list[OrderResponse])
-def get_orders_by_status(status: OrderStatus, db: Session = Depends(get_db)):
-    orders = get_orders_by_status_service(status, db)
+@order_router.get("/orders/status/{status}", response_model=list[Union[OrderResponse, OrderSummaryResponse]])
+def get_orders_by_status(
+    status: OrderStatus,
+    view: OrderView = Query(OrderView.full),
+    order_ids: Optional[List[str]] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """
+    `view=summary` returns scalar columns plus `item_count`; `view=full` returns
+    line items, optionally restricted to the given `order_ids`.
+    """
+    orders = get_orders_by_status_service(status, db, view, order_ids)
     if not orders:
         raise HTTPException(status_code=404, detail=f"No orders found with status '{status}'")
     return orders
 
-@order_router.post("/orders/user", response_model=List[OrderResponse])
+@order_router.post("/orders/user", response_model=List[Union[OrderResponse, OrderSummaryResponse]])
 def get_orders_by_user_or_guest_endpoint(
     request: OrderQueryRequest,
+    view: OrderView = Query(OrderView.full),
+    order_ids: Optional[List[str]] = Query(None),
     db: Session = Depends(get_db)
 ):
-    return get_orders_by_user_or_guest(request, db)
+    return get_orders_by_user_or_guest_service(request, db, view, order_ids)
 
 
 @order_router.get("/order/{order_id}", response_model=OrderResponse)
@@ -65,12 +98,14 @@ def read_order(order_id: str, db: Session = Depends(get_db)):
     return get_order_by_id(order_id, db)
 
 
-@order_router.post("/by-user-or-guest", response_model=List[OrderResponse])
+@order_router.post("/by-user-or-guest", response_model=List[Union[OrderResponse, OrderSummaryResponse]])
 def get_orders_by_user_or_guest(
     request: OrderQueryRequest,
+    view: OrderView = Query(OrderView.full),
+    order_ids: Optional[List[str]] = Query(None),
     db: Session = Depends(get_db)
 ):
-    return get_orders_by_user_or_guest_service(request, db)
+    return get_orders_by_user_or_guest_service(request, db, view, order_ids)
 
 
 @order_router.put("/orders/reason", status_code=status.HTTP_200_OK)
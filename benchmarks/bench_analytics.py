@@ -0,0 +1,125 @@
+"""
+Benchmark: query count and latency of get_analytics_data on 100k orders.
+
+Seeds customers, online and offline orders inside a transaction against
+DATABASE_URL, runs the dashboard computation a few times while counting the
+statements sent to Postgres, then rolls everything back.
+
+    python -m benchmarks.bench_analytics --orders 100000 --repeat 5
+"""
+import argparse
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event, text
+
+from config.db.session import SessionLocal, engine
+from models.base import *  # noqa: F401,F403  (register every mapper)
+from models.customer.order import Order, OrderStatus, PaymentMethod, PaymentStatus
+from models.customer.user import User as CustomerUser
+from models.vendor.offline_orders import OfflineOrder
+from service.vendor.analytics_service import get_analytics_data
+from service.vendor.sales_rollup_service import rebuild_daily_sales_rollup
+from service.vendor.item_sales_service import rebuild_item_sales_stats
+from service.vendor.customer_stats_service import rebuild_customer_stats
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def seed(db, orders: int, customers: int, offline_orders: int):
+    now = datetime.utcnow()
+    user_ids = [str(uuid.uuid4()) for _ in range(customers)]
+    db.bulk_insert_mappings(CustomerUser, [
+        {"id": uid, "name": f"Customer {n % (customers // 2 or 1)}", "phone_number": f"bench-{uid}"}
+        for n, uid in enumerate(user_ids)
+    ])
+
+    statuses = list(OrderStatus)
+    batch = []
+    for i in range(orders):
+        created = now - timedelta(minutes=random.randint(0, 60 * 24 * 540))
+        batch.append({
+            "id": str(uuid.uuid4()),
+            "user_id": random.choice(user_ids),
+            "total_price": round(random.uniform(50, 5000), 2),
+            "items": [{"item_id": "bench", "quantity": 1, "total_price": 100.0}],
+            "order_status": random.choice(statuses),
+            "payment_method": PaymentMethod.cod,
+            "payment_status": PaymentStatus.pending,
+            "is_paid": False,
+            "address": "1 Bench Road",
+            "city": "Chennai",
+            "state": "Tamil Nadu",
+            "created_datetime": created,
+            "updated_datetime": created,
+        })
+        if len(batch) == 5000:
+            db.bulk_insert_mappings(Order, batch)
+            batch = []
+    if batch:
+        db.bulk_insert_mappings(Order, batch)
+
+    db.bulk_insert_mappings(OfflineOrder, [
+        {
+            "id": str(uuid.uuid4()),
+            "order_date": date.today(),
+            "payment_status": "Paid",
+            "payment_method": "Cash",
+            "total_amount": 500.0,
+            "amount_paid": 500.0,
+            "created_by": "bench",
+            "items": [],
+            "is_returned": i % 20 == 0,
+        }
+        for i in range(offline_orders)
+    ])
+    db.flush()
+    rebuild_daily_sales_rollup(db, commit=False)
+    rebuild_item_sales_stats(db, commit=False)
+    rebuild_customer_stats(db, commit=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=100000)
+    parser.add_argument("--customers", type=int, default=5000)
+    parser.add_argument("--offline-orders", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    counter = QueryCounter()
+    try:
+        seed(db, args.orders, args.customers, args.offline_orders)
+        for table in ("orders", "offline_orders", "customer_user"):
+            db.execute(text(f"ANALYZE {table}"))
+        print(f"Seeded {args.orders} online / {args.offline_orders} offline orders\n")
+
+        event.listen(engine, "before_cursor_execute", counter)
+        timings = []
+        for _ in range(args.repeat):
+            counter.count = 0
+            start = time.perf_counter()
+            # The seed is uncommitted, so every query has to stay on this session
+            get_analytics_data(db, concurrent=False)
+            timings.append(time.perf_counter() - start)
+        event.remove(engine, "before_cursor_execute", counter)
+
+        timings.sort()
+        print(f"queries per dashboard load: {counter.count}")
+        print(f"latency best={timings[0] * 1000:.1f} ms  median={timings[len(timings) // 2] * 1000:.1f} ms")
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: in-memory NumPy snapshot vs SQL for ad-hoc analytics queries.
+
+Seeds orders inside a transaction against DATABASE_URL (same data as
+bench_analytics), then times three queries both ways: daily buckets over a
+custom 90-day range, an hour-of-day breakdown, and the weekday x hour
+heatmap. Prints the snapshot's initial load and no-op refresh cost too, and
+rolls everything back.
+
+    python -m benchmarks.bench_analytics_engine --orders 100000 --repeat 20
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from config.db.session import SessionLocal
+from benchmarks.bench_analytics import seed
+from service.vendor import analytics_engine
+
+
+SQL_DAILY = text("""
+    SELECT date_trunc('day', created_datetime) AS bucket, count(*), sum(total_price),
+           count(DISTINCT user_id)
+    FROM orders
+    WHERE created_datetime >= :start AND created_datetime < :end
+    GROUP BY bucket ORDER BY bucket
+""")
+SQL_HOUR_OF_DAY = text("""
+    SELECT extract(hour FROM created_datetime) AS bucket, count(*), sum(total_price)
+    FROM orders
+    WHERE created_datetime >= :start AND created_datetime < :end
+    GROUP BY bucket ORDER BY bucket
+""")
+SQL_HEATMAP = text("""
+    SELECT extract(isodow FROM created_datetime), extract(hour FROM created_datetime),
+           count(*), sum(total_price)
+    FROM orders
+    GROUP BY 1, 2
+""")
+
+
+def timed(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return result, timings[len(timings) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=100000)
+    parser.add_argument("--customers", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        # Bucket in UTC on both sides so the results line up
+        db.execute(text("SET LOCAL TIME ZONE 'UTC'"))
+        seed(db, args.orders, args.customers, 0)
+        db.execute(text("ANALYZE orders"))
+        print(f"Seeded {args.orders} orders\n")
+
+        start = time.perf_counter()
+        analytics_engine.snapshot.refresh(db, force_full=True)
+        print(f"snapshot full load: {(time.perf_counter() - start) * 1000:.1f} ms "
+              f"({analytics_engine.snapshot.stats()['bytes'] / 1e6:.1f} MB)")
+        analytics_engine.snapshot.refreshed_at = 0
+        start = time.perf_counter()
+        analytics_engine.snapshot.refresh(db)
+        print(f"snapshot incremental refresh (no changes): {(time.perf_counter() - start) * 1000:.1f} ms\n")
+
+        end = datetime.utcnow()
+        window = {"start": end - timedelta(days=90), "end": end}
+        cases = [
+            ("daily buckets, 90 days",
+             lambda: db.execute(SQL_DAILY, window).all(),
+             lambda: analytics_engine.aggregate(db, "day", channel="online", utc_offset_minutes=0, **window)),
+            ("hour of day, 90 days",
+             lambda: db.execute(SQL_HOUR_OF_DAY, window).all(),
+             lambda: analytics_engine.aggregate(db, "hour_of_day", channel="online", utc_offset_minutes=0, **window)),
+            ("weekday x hour heatmap",
+             lambda: db.execute(SQL_HEATMAP).all(),
+             lambda: analytics_engine.heatmap(db, channel="online", utc_offset_minutes=0)),
+        ]
+
+        print(f"{'query':<26}{'sql ms':>10}{'engine ms':>12}{'speedup':>10}")
+        for name, sql, engine in cases:
+            sql_rows, sql_ms = timed(sql, args.repeat)
+            engine_rows, engine_ms = timed(engine, args.repeat)
+            if isinstance(engine_rows, list):
+                assert sum(r[1] for r in sql_rows) == sum(r["order_count"] for r in engine_rows), name
+            print(f"{name:<26}{sql_ms:>10.2f}{engine_ms:>12.2f}{sql_ms / engine_ms:>9.1f}x")
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: autocomplete lookups against the in-memory prefix index.
+
+Builds the index from synthetic item and category names (no database
+needed), then replays every prefix of random names the way a user typing
+them would and reports p50/p99/max lookup latency, plus the cost of a full
+build and of an incremental upsert/remove.
+
+    python -m benchmarks.bench_autocomplete --items 100000 --queries 20000
+"""
+import argparse
+import random
+import time
+import uuid
+
+from service.vendor.autocomplete_service import CATEGORY, ITEM, PrefixIndex
+
+
+ADJECTIVES = ["fresh", "organic", "red", "green", "baby", "country", "premium", "farm", "golden", "wild",
+              "sweet", "dried", "raw", "whole", "roasted", "local", "hill", "white", "black", "long"]
+NOUNS = ["tomato", "onion", "potato", "spinach", "carrot", "mango", "banana", "apple", "rice", "wheat",
+         "lentils", "ginger", "garlic", "chilli", "coriander", "cabbage", "beans", "brinjal", "okra", "papaya",
+         "grapes", "orange", "turmeric", "jaggery", "almonds", "cashews", "peas", "millet", "pumpkin", "radish"]
+
+
+def synthetic_name(rng: random.Random) -> str:
+    words = rng.sample(ADJECTIVES, rng.randint(0, 2)) + [rng.choice(NOUNS)]
+    return " ".join(words).title() + f" {rng.choice(['250g', '500g', '1kg', '5kg'])} #{rng.randint(1, 9999)}"
+
+
+def percentile(sorted_values, pct):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--categories", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    names = {(ITEM, str(uuid.UUID(int=rng.getrandbits(128)))): synthetic_name(rng) for _ in range(args.items)}
+    names.update({(CATEGORY, str(uuid.UUID(int=rng.getrandbits(128)))): f"{rng.choice(NOUNS).title()} {n}"
+                  for n in range(args.categories)})
+
+    index = PrefixIndex()
+    start = time.perf_counter()
+    index.load(names)
+    print(f"build: {(time.perf_counter() - start) * 1000:.0f} ms for {index.stats()['names']} names "
+          f"({index.stats()['entries']} entries)")
+
+    # Every keystroke of a typed name is one request
+    typed = [name.lower() for name in rng.sample(list(names.values()), 2000)]
+    prefixes = [text[:n] for text in typed for n in range(1, min(len(text), 12) + 1)]
+    prefixes = [rng.choice(prefixes) for _ in range(args.queries)]
+
+    timings = []
+    hits = 0
+    for prefix in prefixes:
+        start = time.perf_counter()
+        result = index.lookup(prefix, args.limit)
+        timings.append(time.perf_counter() - start)
+        hits += bool(result)
+    timings.sort()
+    print(f"lookup: p50 {percentile(timings, 0.50) * 1e6:.0f} us, p99 {percentile(timings, 0.99) * 1e6:.0f} us, "
+          f"max {timings[-1] * 1e6:.0f} us over {len(timings)} prefixes ({hits / len(timings):.0%} with results)")
+
+    refs = rng.sample(list(names), 1000)
+    start = time.perf_counter()
+    for kind, ref_id in refs:
+        index.upsert(kind, ref_id, synthetic_name(rng))
+    upsert_us = (time.perf_counter() - start) / len(refs) * 1e6
+    start = time.perf_counter()
+    for kind, ref_id in refs:
+        index.remove(kind, ref_id)
+    remove_us = (time.perf_counter() - start) / len(refs) * 1e6
+    print(f"incremental: upsert {upsert_us:.0f} us, remove {remove_us:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
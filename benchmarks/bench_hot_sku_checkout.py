@@ -0,0 +1,120 @@
+"""
+Load test: concurrent checkouts of a single hot SKU.
+
+Places `--orders` orders for one item from `--workers` threads (one session
+each) through create_order, first with plain stock updates on the items row,
+then with the item split into `--slots` reservation slots. Prints throughput
+for both runs, settles the reservations and checks that the slotted run
+accounted for every unit.
+All rows it creates are deleted afterwards.
+
+    python -m benchmarks.bench_hot_sku_checkout --orders 2000 --workers 12 --slots 32
+"""
+import argparse
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from config.db.session import SessionLocal
+from models.base import *  # noqa: F401,F403  (register every mapper)
+from models.vendor.user import User as VendorUser
+from models.vendor.category import Category
+from models.vendor.items import Item
+from models.customer.order import Order
+from models.vendor.stock_reservation import StockSlot, StockReservation
+from schema.customer.order import CreateOrderRequest, OrderItemInput, PaymentMethod
+from service.customer.order import create_order
+from service.vendor.stock_reservation_service import provision_stock_slots, settle_committed_reservations
+
+STOCK = 1_000_000
+
+
+def setup(db, tag: str) -> str:
+    vendor = VendorUser(id=str(uuid.uuid4()), email=f"{tag}@bench.local", phone_number=tag, name="bench")
+    category = Category(id=str(uuid.uuid4()), vendor_id=vendor.id, category_name=f"bench-{tag}")
+    item = Item(
+        id=str(uuid.uuid4()), category_id=category.id, item_name=f"Hot SKU {tag}",
+        item_price=100.0, discount=0.0, final_price=100.0, kg=1.0, quality="A", quantity=STOCK,
+    )
+    db.add(vendor)
+    db.flush()
+    db.add(category)
+    db.flush()
+    db.add(item)
+    db.commit()
+    return item.id
+
+
+def place_one(item_id: str, user_id: str):
+    db = SessionLocal()
+    try:
+        create_order(CreateOrderRequest(
+            user_id=user_id,
+            items=[OrderItemInput(
+                item_id=item_id, item_name="Hot SKU", item_price=100.0, mrp_price=100.0,
+                discount=0.0, additional_discount=0.0, quantity=1, unit_price=100.0, product_image=None,
+            )],
+            payment_method=PaymentMethod.cod,
+            address="1 Bench Road", city="Chennai", state="Tamil Nadu",
+        ), db)
+    finally:
+        db.close()
+
+
+def run(label: str, item_id: str, user_id: str, orders: int, workers: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(place_one, item_id, user_id) for _ in range(orders)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {orders} orders in {elapsed:6.2f}s  ->  {orders / elapsed:8.1f} orders/s")
+    return elapsed
+
+
+def cleanup(db, item_id: str, user_id: str, tag: str):
+    db.query(Order).filter(Order.user_id == user_id).delete(synchronize_session=False)
+    db.query(StockReservation).filter(StockReservation.item_id == item_id).delete(synchronize_session=False)
+    db.query(StockSlot).filter(StockSlot.item_id == item_id).delete(synchronize_session=False)
+    item = db.get(Item, item_id)
+    category = db.get(Category, item.category_id)
+    db.delete(item)
+    db.flush()
+    db.delete(category)
+    db.flush()
+    db.query(VendorUser).filter(VendorUser.phone_number == tag).delete(synchronize_session=False)
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=12)  # stay within the engine pool (5 + 10 overflow)
+    parser.add_argument("--slots", type=int, default=32)
+    args = parser.parse_args()
+
+    tag = uuid.uuid4().hex[:12]
+    user_id = f"bench-{tag}"
+    db = SessionLocal()
+    item_id = setup(db, tag)
+    try:
+        before = run("row lock on items", item_id, user_id, args.orders, args.workers)
+
+        db.expire_all()
+        stock_before_slots = db.get(Item, item_id).quantity
+        provision_stock_slots(db, item_id, args.slots)
+        after = run(f"{args.slots} reservation slots", item_id, user_id, args.orders, args.workers)
+        print(f"speed-up: {before / after:.2f}x")
+
+        while settle_committed_reservations(db, 1000):
+            pass
+        db.expire_all()
+        remaining = db.get(Item, item_id).quantity
+        expected = stock_before_slots - args.orders
+        print(f"stock after settlement: {remaining} (expected {expected})")
+    finally:
+        cleanup(db, item_id, user_id, tag)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark: summary vs full order listings on 10k orders.
+
+Seeds orders inside a transaction against DATABASE_URL, times
+get_orders_by_status_service / get_orders_by_user_or_guest in both views,
+then rolls everything back so the database is left untouched.
+
+    python -m benchmarks.bench_order_views --orders 10000 --repeat 5
+"""
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from config.db.session import SessionLocal
+from models.base import *  # noqa: F401,F403  (register every mapper)
+from models.customer.order import Order, OrderStatus, PaymentMethod, PaymentStatus
+from schema.customer.order import OrderQueryRequest, OrderView
+from service.customer.order import get_orders_by_status_service, get_orders_by_user_or_guest
+
+
+def seed_orders(db, count: int, user_id: str):
+    now = datetime.utcnow()
+    rows = []
+    for i in range(count):
+        line_count = random.randint(1, 8)
+        items = [
+            {
+                "item_id": str(uuid.uuid4()),
+                "item_name": f"Item {n}",
+                "mrp_price": 120.0,
+                "unit_price": 100.0,
+                "discount": 10.0,
+                "additional_discount": 0.0,
+                "quantity": 2,
+                "total_price": 200.0,
+                "product_image": "uploads/sample.png",
+                "note": "",
+            }
+            for n in range(line_count)
+        ]
+        created = now - timedelta(minutes=i)
+        rows.append({
+            "id": str(uuid.uuid4()),
+            # every 10th order belongs to the user we query for
+            "user_id": user_id if i % 10 == 0 else str(uuid.uuid4()),
+            "total_price": 200.0 * line_count,
+            "items": items,
+            "order_status": random.choice([OrderStatus.pending, OrderStatus.completed]),
+            "payment_method": PaymentMethod.cod,
+            "payment_status": PaymentStatus.pending,
+            "is_paid": False,
+            "address": "12 Bench Street",
+            "city": "Chennai",
+            "state": "Tamil Nadu",
+            "created_datetime": created,
+            "updated_datetime": created,
+        })
+    db.bulk_insert_mappings(Order, rows)
+    db.flush()
+
+
+def timed(label: str, fn, repeat: int):
+    best = None
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        size = len(result)
+    print(f"{label:<40} rows={size:<6} best={best * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    user_id = str(uuid.uuid4())
+    try:
+        seed_orders(db, args.orders, user_id)
+        print(f"Seeded {args.orders} orders\n")
+
+        for view in (OrderView.full, OrderView.summary):
+            timed(
+                f"status=Pending view={view.value}",
+                lambda: get_orders_by_status_service(OrderStatus.pending, db, view),
+                args.repeat,
+            )
+        for view in (OrderView.full, OrderView.summary):
+            timed(
+                f"user orders view={view.value}",
+                lambda: get_orders_by_user_or_guest(OrderQueryRequest(user_id=user_id), db, view),
+                args.repeat,
+            )
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
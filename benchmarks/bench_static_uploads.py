@@ -0,0 +1,112 @@
+"""
+Benchmark: image fetches from /uploads, plain StaticFiles vs UploadStaticFiles.
+
+Writes a few synthetic images into a temp directory (a legacy-named upload,
+a content-addressed upload and a jpeg/webp variant pair), then drives both
+ASGI apps directly, with no sockets, and reports requests per second for:
+a full fetch, a browser revalidation (If-None-Match), a 64 KiB range
+request, and a variant fetch with `Accept: image/webp`. For the immutable
+URLs a browser makes no request at all after the first one; the
+revalidation row shows what every page view costs without that.
+
+    python -m benchmarks.bench_static_uploads --requests 5000 --concurrency 50
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+
+from starlette.staticfiles import StaticFiles
+
+from utils.static_files import UploadStaticFiles
+
+
+async def fetch(app, path: str, headers: dict):
+    scope = {
+        "type": "http", "method": "GET", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "http_version": "1.1", "scheme": "http", "server": ("bench", 80),
+        # 2.4: the response need not watch receive() for a disconnect
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    }
+    result = {"status": None, "headers": {}, "bytes": 0}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+            result["headers"] = {k.decode(): v.decode() for k, v in message["headers"]}
+        elif message["type"] == "http.response.body":
+            result["bytes"] += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return result
+
+
+async def rate(app, path: str, headers: dict, requests: int, concurrency: int) -> float:
+    async def worker(count):
+        for _ in range(count):
+            await fetch(app, path, headers)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+    return (requests // concurrency * concurrency) / (time.perf_counter() - start)
+
+
+def write(directory: str, name: str, size: int) -> str:
+    with open(os.path.join(directory, name), "wb") as f:
+        f.write(os.urandom(size))
+    return name
+
+
+async def run(args):
+    directory = tempfile.mkdtemp(prefix="bench-uploads-")
+    legacy = write(directory, "Screenshot 2025-04-16 110028.png", args.size)
+    content = os.urandom(args.size)
+    stored = hashlib.sha256(content).hexdigest() + ".png"
+    with open(os.path.join(directory, stored), "wb") as f:
+        f.write(content)
+    variant = write(directory, "tomato-0123456789abcdef.card.jpeg", args.size // 4)
+    write(directory, "tomato-0123456789abcdef.card.webp", args.size // 6)
+
+    apps = {"StaticFiles": StaticFiles(directory=directory), "UploadStaticFiles": UploadStaticFiles(directory=directory)}
+    print(f"{'case':<34}{'app':<20}{'status':>7}{'bytes':>9}{'req/s':>10}")
+    for label, name in (("legacy name", legacy), ("content-addressed", stored)):
+        for app_name, app in apps.items():
+            path = "/" + name
+            first = await fetch(app, path, {})
+            cases = [
+                (f"{label}: full fetch", {}),
+                (f"{label}: revalidate", {"If-None-Match": first["headers"]["etag"]}),
+                (f"{label}: range 64 KiB", {"Range": "bytes=0-65535"}),
+            ]
+            for case, headers in cases:
+                sample = await fetch(app, path, headers)
+                rps = await rate(app, path, headers, args.requests, args.concurrency)
+                print(f"{case:<34}{app_name:<20}{sample['status']:>7}{sample['bytes']:>9}{rps:>10.0f}")
+            print(f"{'':<34}{app_name:<20}  cache-control: {first['headers'].get('cache-control', '-')}")
+
+    accept = {"Accept": "image/avif,image/webp,image/*,*/*;q=0.8"}
+    for app_name, app in apps.items():
+        sample = await fetch(app, "/" + variant, accept)
+        rps = await rate(app, "/" + variant, accept, args.requests, args.concurrency)
+        print(f"{'variant, Accept: image/webp':<34}{app_name:<20}{sample['status']:>7}{sample['bytes']:>9}{rps:>10.0f}"
+              f"  ({sample['headers'].get('content-type')})")
+    shutil.rmtree(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--size", type=int, default=400 * 1024, help="Bytes per original image")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,6 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import configure_mappers
 from dotenv import load_dotenv
-from fastapi.staticfiles import StaticFiles
 import os
 import logging
 
@@ -22,6 +21,11 @@ from api.customer.order import order_router
 from api.customer.address import address_router
 from api.customer.guest_user import guest_user_router
 from api.vendor.offline_orders import offline_router
+from api.vendor.reports import report_router
+from config.db.session import SessionLocal
+from service.vendor.autocomplete_service import rebuild_autocomplete_index
+from utils.pg_notify import listener as pg_listener
+from utils.static_files import UploadStaticFiles
 
 # Create uploads folder if it doesn't exist
 if not os.path.exists("uploads"):
@@ -59,8 +63,30 @@ app.add_middleware(
 # ✅ Configure mappers
 configure_mappers()
 
+# ✅ Warm the in-memory autocomplete index
+@app.on_event("startup")
+def build_autocomplete_index():
+    db = SessionLocal()
+    try:
+        rebuild_autocomplete_index(db)
+    except Exception:
+        # The first autocomplete request retries the build
+        logger.exception("Could not build the autocomplete index at startup")
+    finally:
+        db.close()
+
+# ✅ Cross-worker cache invalidation (LISTEN/NOTIFY)
+@app.on_event("startup")
+def start_pg_listener():
+    pg_listener.start()
+
+
+@app.on_event("shutdown")
+def stop_pg_listener():
+    pg_listener.stop()
+
 # ✅ Mount static files
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+app.mount("/uploads", UploadStaticFiles(directory="uploads"), name="uploads")
 
 # ✅ Include routers
 app.include_router(vendor_user_router, prefix="/api/vendor/users", tags=["Vendor Users"])
@@ -69,6 +95,7 @@ app.include_router(category_router, prefix="/categories")
 app.include_router(analytics_router, prefix="/analytics")
 app.include_router(item_router, prefix="/items")
 app.include_router(offline_router, prefix="/offline-order", tags=["Offline Order"])
+app.include_router(report_router, prefix="/reports")
 # app.include_router(order_items_router, prefix="/order-items")
 
 app.include_router(otp_router, prefix="/api/customer/auth/otp", tags=["Customer OTP"])
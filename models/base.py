@@ -7,4 +7,11 @@ from models.customer.order import Order
 from models.customer.address import Address
 from models.vendor.order_items import OrderItem
 from models.customer.guest_user import GuestUser
-from models.vendor.offline_orders import OfflineOrder
\ No newline at end of file
+from models.vendor.offline_orders import OfflineOrder
+from models.vendor.stock_reservation import StockSlot, StockReservation
+from models.vendor.daily_sales_rollup import DailySalesRollup, RegionalSalesRollup
+from models.vendor.item_sales_stats import ItemSalesStats
+from models.vendor.customer_stats import CustomerStats
+from models.vendor.stock_alert import StockAlert
+from models.vendor.customer_segment import CustomerSegment
+from models.vendor.report_job import ReportJob
\ No newline at end of file
@@ -21,6 +21,9 @@ class PaymentStatus(str, Enum):
 
 class Order(Base):
     __tablename__ = "orders"
+    # Range-partitioned by month on created_datetime (see scripts/order_partitions.py),
+    # so the partition key is part of the primary key.
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_datetime)"}
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
 
@@ -47,7 +50,9 @@ class Order(Base):
     state = Column(String, nullable=False)
     created_datetime = Column(
         TIMESTAMP(timezone=True),
+        primary_key=True,
         nullable=False,
+        index=True,
         server_default=text("CURRENT_TIMESTAMP")
     )
 
@@ -24,6 +24,11 @@ class PaymentStatus(str, Enum):
     failed = "Failed"
 
 
+class OrderView(str, Enum):
+    summary = "summary"
+    full = "full"
+
+
 class OrderItemInput(BaseModel):
     item_id: str
     item_name: str
@@ -64,6 +69,7 @@ class CreateOrderRequest(BaseModel):
     total_discount_amount: Optional[float] = None
     total_payable: Optional[float] = None
     effective_discount_percent: Optional[float] = None
+    reservation_ids: Optional[List[str]] = None  # from POST /orders/reservations at checkout start
 
 class UpdateOrderStatusRequest(BaseModel):
     order_status: OrderStatus
@@ -98,6 +104,28 @@ class OrderResponse(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+
+class OrderSummaryResponse(BaseModel):
+    id: str
+    user_id: Optional[str]
+    guest_user_id: Optional[str]
+    total_price: float
+    item_count: int
+    order_status: OrderStatus
+    payment_method: PaymentMethod
+    payment_status: PaymentStatus
+    is_paid: bool
+    reason: Optional[str] = None
+
+    address: str
+    city: str
+    state: str
+
+    created_datetime: datetime
+    updated_datetime: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
    
 class OrderReasonUpdate(BaseModel):
     order_id: str
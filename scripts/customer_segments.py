@@ -0,0 +1,49 @@
+"""
+Batch RFM segmentation of customers and guests into customer_segments.
+
+    python -m scripts.customer_segments run
+    python -m scripts.customer_segments run --every 86400
+
+Without --every it runs once (suits cron); with it, it repeats forever.
+"""
+import argparse
+import logging
+import time
+
+from config.db.session import SessionLocal
+from models.base import *  # noqa: F401,F403  (register every mapper)
+from service.vendor.customer_segment_service import compute_customer_segments
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def run_once(chunk_size: int) -> int:
+    db = SessionLocal()
+    try:
+        return compute_customer_segments(db, chunk_size)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute RFM customer segments")
+    parser.add_argument("command", choices=["run"])
+    parser.add_argument("--chunk-size", type=int, default=20000, help="Orders fetched per round trip")
+    parser.add_argument("--every", type=float, default=None, help="Repeat every N seconds")
+    args = parser.parse_args()
+
+    if args.every is None:
+        print(f"Segmented {run_once(args.chunk_size)} customer(s)")
+        return
+
+    while True:
+        try:
+            run_once(args.chunk_size)
+        except Exception:
+            logger.exception("Segmentation run failed")
+        time.sleep(args.every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Item image variants.
+
+    python -m scripts.images backfill            # images that have no variants yet
+    python -m scripts.images backfill --force    # re-render everything
+
+Renders in the image process pool (IMAGE_WORKERS processes).
+"""
+import argparse
+import logging
+
+from models.base import *  # noqa: F401,F403  (register every mapper)
+from config.db.session import SessionLocal
+from service.vendor.image_service import backfill_item_variants
+
+logging.basicConfig(level=logging.INFO)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render thumbnail/card/full variants of item images")
+    parser.add_argument("command", choices=["backfill"])
+    parser.add_argument("--force", action="store_true", help="Re-render images that already have variants")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print(f"Rendered {backfill_item_variants(db, force=args.force)} image(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Maintenance for the monthly partitions of the `orders` table.
+
+    python -m scripts.order_partitions list
+    python -m scripts.order_partitions ensure --months-ahead 3
+    python -m scripts.order_partitions archive --older-than-months 24 --mode archive [--dry-run]
+
+Run `ensure` from cron (e.g. daily) so the next months always exist before
+orders are written to them.
+"""
+import argparse
+
+from config.db.session import SessionLocal
+from service.vendor.order_partitions import (
+    list_order_partitions,
+    ensure_future_partitions,
+    archive_old_partitions,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage monthly partitions of the orders table")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="Show attached partitions and their bounds")
+
+    ensure = commands.add_parser("ensure", help="Pre-create partitions for upcoming months")
+    ensure.add_argument("--months-ahead", type=int, default=3)
+
+    archive = commands.add_parser("archive", help="Detach or archive old partitions")
+    archive.add_argument("--older-than-months", type=int, required=True)
+    archive.add_argument("--mode", choices=["detach", "archive"], default="detach")
+    archive.add_argument("--dry-run", action="store_true")
+
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.command == "list":
+            for partition in list_order_partitions(db):
+                print(f"{partition['name']:<24} {partition['bounds']}")
+        elif args.command == "ensure":
+            created = ensure_future_partitions(db, args.months_ahead)
+            print(f"Created {len(created)} partition(s): {', '.join(created) or '-'}")
+        elif args.command == "archive":
+            names = archive_old_partitions(db, args.older_than_months, args.mode, args.dry_run)
+            verb = "Would process" if args.dry_run else "Processed"
+            print(f"{verb} {len(names)} partition(s): {', '.join(names) or '-'}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Out-of-process worker for queued report jobs.
+
+    python -m scripts.report_jobs run --interval 2
+    python -m scripts.report_jobs drain
+
+The API's in-process pool picks up jobs as they are created; this worker
+catches anything left queued (e.g. after a restart) or takes the load off
+the API processes entirely. Both claim with SKIP LOCKED, so they can share
+the queue.
+"""
+import argparse
+import logging
+import time
+
+from models.base import *  # noqa: F401,F403  (register every mapper)
+from service.vendor.report_service import run_report_job
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def drain() -> int:
+    done = 0
+    while run_report_job():
+        done += 1
+    return done
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run queued report jobs")
+    parser.add_argument("command", choices=["run", "drain"])
+    parser.add_argument("--interval", type=float, default=2.0, help="Seconds between queue polls for `run`")
+    args = parser.parse_args()
+
+    if args.command == "drain":
+        print(f"Ran {drain()} report job(s)")
+        return
+
+    while True:
+        try:
+            drain()
+        except Exception:
+            logger.exception("Report worker pass failed")
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
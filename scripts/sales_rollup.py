@@ -0,0 +1,44 @@
+"""
+Backfill / rebuild of the sales rollup tables from orders and offline_orders.
+
+    python -m scripts.sales_rollup rebuild             # daily_sales_rollup
+    python -m scripts.sales_rollup rebuild-items       # item_sales_stats
+    python -m scripts.sales_rollup rebuild-customers   # customer_stats
+    python -m scripts.sales_rollup rebuild-regions     # regional_sales_rollup
+
+Safe to run on a live database: order writes wait for the rebuild to commit.
+"""
+import argparse
+
+from config.db.session import SessionLocal
+from models.base import *  # noqa: F401,F403  (register every mapper)
+from service.vendor.sales_rollup_service import rebuild_daily_sales_rollup, rebuild_regional_sales_rollup
+from service.vendor.item_sales_service import rebuild_item_sales_stats
+from service.vendor.customer_stats_service import rebuild_customer_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the daily sales rollup")
+    parser.add_argument("command", choices=["rebuild", "rebuild-items", "rebuild-customers", "rebuild-regions"])
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.command == "rebuild":
+            rows = rebuild_daily_sales_rollup(db)
+            print(f"daily_sales_rollup rebuilt: {rows} row(s)")
+        elif args.command == "rebuild-items":
+            rows = rebuild_item_sales_stats(db)
+            print(f"item_sales_stats rebuilt: {rows} row(s)")
+        elif args.command == "rebuild-customers":
+            rows = rebuild_customer_stats(db)
+            print(f"customer_stats rebuilt: {rows} row(s)")
+        else:
+            rows = rebuild_regional_sales_rollup(db)
+            print(f"regional_sales_rollup rebuilt: {rows} row(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
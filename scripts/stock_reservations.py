@@ -0,0 +1,60 @@
+"""
+Settlement worker for stock reservations.
+
+    python -m scripts.stock_reservations settle
+    python -m scripts.stock_reservations release-expired
+    python -m scripts.stock_reservations run --interval 5
+
+`run` loops forever doing both; the one-shot commands suit cron.
+"""
+import argparse
+import logging
+import time
+
+from config.db.session import SessionLocal
+from models.base import *  # noqa: F401,F403  (register every mapper)
+from service.vendor.stock_reservation_service import (
+    settle_committed_reservations,
+    release_expired_reservations,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def drain(fn, batch_size: int) -> int:
+    total = 0
+    db = SessionLocal()
+    try:
+        while True:
+            processed = fn(db, batch_size)
+            total += processed
+            if processed < batch_size:
+                return total
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Settle and expire stock reservations")
+    parser.add_argument("command", choices=["settle", "release-expired", "run"])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between passes for `run`")
+    args = parser.parse_args()
+
+    if args.command == "settle":
+        print(f"Settled {drain(settle_committed_reservations, args.batch_size)} reservation(s)")
+    elif args.command == "release-expired":
+        print(f"Released {drain(release_expired_reservations, args.batch_size)} reservation(s)")
+    else:
+        while True:
+            try:
+                drain(release_expired_reservations, args.batch_size)
+                drain(settle_committed_reservations, args.batch_size)
+            except Exception:
+                logger.exception("Reservation pass failed")
+            time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Find and remove uploads that no item or order references.
+
+    python -m scripts.upload_gc                                  # dry run: report only
+    python -m scripts.upload_gc --delete --grace-hours 48
+    python -m scripts.upload_gc --quarantine uploads_quarantine  # move aside instead
+
+Quarantine moves files outside the served uploads/ directory so they can be
+restored by moving them back.
+"""
+import argparse
+import logging
+
+from models.base import *  # noqa: F401,F403  (register every mapper)
+from config.db.session import SessionLocal
+from service.vendor.upload_gc_service import DELETE, QUARANTINE, REPORT, collect_orphans
+
+logging.basicConfig(level=logging.INFO)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Garbage-collect unreferenced uploads")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--delete", action="store_true", help="Delete orphans (default is a dry run)")
+    action.add_argument("--quarantine", metavar="DIR", help="Move orphans into DIR instead of deleting")
+    parser.add_argument("--grace-hours", type=float, default=24, help="Never touch files younger than this")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches")
+    parser.add_argument("--list", action="store_true", help="Print every orphan in the report")
+    args = parser.parse_args()
+
+    mode = DELETE if args.delete else QUARANTINE if args.quarantine else REPORT
+    db = SessionLocal()
+    try:
+        report = collect_orphans(
+            db, mode, args.grace_hours, args.batch_size, args.pause, quarantine_dir=args.quarantine
+        )
+    finally:
+        db.close()
+
+    if args.list or mode == REPORT:
+        for ref in report["files"]:
+            print(ref)
+    print(f"{report['orphans']} orphan(s), {report['bytes'] / (1024 * 1024):.1f} MB older than {args.grace_hours:g}h")
+    if mode != REPORT:
+        print(f"{mode}: {report['processed']} done, {report['failed']} failed, "
+              f"{report['skipped']} skipped (in use or re-uploaded since the listing)")
+
+
+if __name__ == "__main__":
+    main()
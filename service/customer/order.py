@@ -5,13 +5,25 @@ from models.customer.cart import Cart
 from models.customer.user import User as CustomerUser
 from models.vendor.user import User as VendorUser
 from models.vendor.items import Item
-from schema.customer.order import CreateOrderRequest, OrderResponse,OrderStatus, OrderQueryRequest, OrderReasonUpdate, OrderItem
-from sqlalchemy import func
+from schema.customer.order import CreateOrderRequest, OrderResponse,OrderStatus, OrderQueryRequest, OrderReasonUpdate, OrderItem, OrderSummaryResponse, OrderView
+from sqlalchemy import case, func
 from datetime import datetime
 from models.customer.user import User
 from models.customer.guest_user import GuestUser
-from typing import List
+from typing import List, Optional, Union
 from service.sms_service import send_order_decline_email
+from service.vendor.stock_reservation_service import (
+    reserve_stock,
+    take_held_reservations,
+    commit_reservations,
+    release_held_reservations,
+    resync_stock_slots,
+)
+from service.vendor.sales_rollup_service import record_online_order, record_online_status_change
+from service.vendor.item_sales_service import record_online_order_sales, record_online_status_sales
+from service.vendor.customer_stats_service import record_customer_order, record_customer_status_change
+from service.vendor.stock_alert_service import check_stock_threshold
+from service.vendor.analytics_service import invalidate_analytics
 import uuid
 import json
 
@@ -21,19 +33,32 @@ def create_order(request: CreateOrderRequest, db: Session) -> OrderResponse:
 
     total_price = 0.0
     order_items = []
+    reservations = []
+    held = take_held_reservations(db, request.reservation_ids)
 
     for item_input in request.items:
         item = db.query(Item).filter(Item.id == item_input.item_id).first()
         if not item:
             raise HTTPException(status_code=404, detail=f"Item with ID {item_input.item_id} not found.")
-        if item.quantity < item_input.quantity:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Not enough stock for item '{item.item_name}'. Only {item.quantity} left."
-            )
 
-        item.quantity -= item_input.quantity
-        db.add(item)
+        if item.reservation_slots:
+            # Hot item: claim from a stock slot instead of locking the items row
+            claimed = held.pop(item.id, [])
+            if sum(r.quantity for r in claimed) != item_input.quantity:
+                release_held_reservations(db, claimed)
+                claimed = reserve_stock(db, item, item_input.quantity)
+            reservations.extend(claimed)
+        else:
+            if item.quantity < item_input.quantity:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Not enough stock for item '{item.item_name}'. Only {item.quantity} left."
+                )
+
+            previous_quantity = item.quantity
+            item.quantity -= item_input.quantity
+            db.add(item)
+            check_stock_threshold(db, item, previous_quantity)
 
         # ✅ Apply only base discount on MRP price
         mrp_price = item_input.mrp_price
@@ -74,6 +99,12 @@ def create_order(request: CreateOrderRequest, db: Session) -> OrderResponse:
     )
 
     db.add(order)
+    record_online_order(db, order)
+    record_online_order_sales(db, order)
+    record_customer_order(db, order)
+    commit_reservations(db, reservations, order.id)
+    # Reservations held for items that are no longer in the order
+    release_held_reservations(db, [r for group in held.values() for r in group])
 
     # 🧹 Clear cart
     if request.user_id:
@@ -82,6 +113,7 @@ def create_order(request: CreateOrderRequest, db: Session) -> OrderResponse:
         db.query(Cart).filter(Cart.guest_user_id == request.guest_user_id).delete()
 
     db.commit()
+    invalidate_analytics()
     db.refresh(order)
 
     return OrderResponse.from_orm(order)
@@ -100,12 +132,19 @@ def update_order_status_service(order_id: str, status: OrderStatus, db: Session)
 
             item = db.query(Item).filter(Item.id == item_id).first()
             if item:
+                previous_quantity = item.quantity
                 item.quantity += quantity
+                resync_stock_slots(db, item)
+                check_stock_threshold(db, item, previous_quantity)
             else:
                 raise Exception(f"Item not found for item_id {item_id}")
 
     # Update the order status
+    previous_status = order.order_status
     order.order_status = status.value
+    record_online_status_change(db, order, previous_status, status)
+    record_online_status_sales(db, order, previous_status, status)
+    record_customer_status_change(db, order, previous_status, status)
 
     # Set payment status and is_paid based on order status
     if status == OrderStatus.completed:
@@ -116,6 +155,7 @@ def update_order_status_service(order_id: str, status: OrderStatus, db: Session)
         order.payment_status = PaymentStatus.pending
 
     db.commit()
+    invalidate_analytics()
     return "Order status updated"
 
 
@@ -127,71 +167,126 @@ def get_all_orders_service(db: Session) -> List[Order]:
 
 
 
-def get_orders_by_status_service(status: OrderStatus, db: Session) -> List[OrderResponse]:
-    orders = db.query(Order).filter(Order.order_status == status).all()
-    order_responses = []
-
-    for order in orders:
-        # Parse items if stored as JSON string
-        items_data = order.items
-        if isinstance(items_data, str):
-            try:
-                items_data = json.loads(items_data)
-            except json.JSONDecodeError:
-                items_data = []
-                print(f"⚠️ Failed to decode items JSON for order ID: {order.id}")
-
-        items = []
-        for item in items_data:
-            items.append(OrderItem(
-                item_id=item.get("item_id"),
-                item_name=item.get("item_name"),
-                quantity=item.get("quantity", 0),
-                unit_price=item.get("unit_price", item.get("item_price", 0.0)),
-                total_price=item.get("total_price", 0.0),  # Prevent KeyError here
-                discount=item.get("discount", 0.0),
-                additional_discount=item.get("additional_discount", 0.0),
-                product_image=item.get("product_image"),
-                note=item.get("note", "")
-            ))
-
-        order_responses.append(OrderResponse(
-            id=order.id,
-            user_id=order.user_id,
-            guest_user_id=order.guest_user_id,
-            total_price=order.total_price,
-            items=items,
-            order_status=order.order_status,
-            payment_method=order.payment_method,
-            payment_status=order.payment_status,
-            is_paid=order.is_paid,
-            reason=order.reason,
-            razorpay_order_id=order.razorpay_order_id,
-            razorpay_payment_id=order.razorpay_payment_id,
-            razorpay_signature=order.razorpay_signature,
-            address=order.address,
-            city=order.city,
-            state=order.state,
-            created_datetime=order.created_datetime,
-            updated_datetime=order.updated_datetime
+def _parse_order_items(order_id: str, items_data) -> List[OrderItem]:
+    # Parse items if stored as JSON string
+    if isinstance(items_data, str):
+        try:
+            items_data = json.loads(items_data)
+        except json.JSONDecodeError:
+            items_data = []
+            print(f"⚠️ Failed to decode items JSON for order ID: {order_id}")
+
+    items = []
+    for item in items_data or []:
+        items.append(OrderItem(
+            item_id=item.get("item_id"),
+            item_name=item.get("item_name"),
+            quantity=item.get("quantity", 0),
+            unit_price=item.get("unit_price", item.get("item_price", 0.0)),
+            total_price=item.get("total_price", 0.0),  # Prevent KeyError here
+            discount=item.get("discount", 0.0),
+            additional_discount=item.get("additional_discount", 0.0),
+            product_image=item.get("product_image"),
+            note=item.get("note", "")
         ))
+    return items
+
+
+def _build_order_response(order: Order) -> OrderResponse:
+    return OrderResponse(
+        id=order.id,
+        user_id=order.user_id,
+        guest_user_id=order.guest_user_id,
+        total_price=order.total_price,
+        items=_parse_order_items(order.id, order.items),
+        order_status=order.order_status,
+        payment_method=order.payment_method,
+        payment_status=order.payment_status,
+        is_paid=order.is_paid,
+        reason=order.reason,
+        razorpay_order_id=order.razorpay_order_id,
+        razorpay_payment_id=order.razorpay_payment_id,
+        razorpay_signature=order.razorpay_signature,
+        address=order.address,
+        city=order.city,
+        state=order.state,
+        created_datetime=order.created_datetime,
+        updated_datetime=order.updated_datetime
+    )
+
+
+def _order_summary_query(db: Session):
+    # Scalar columns only; the items JSON never leaves Postgres, just its length
+    return db.query(
+        Order.id,
+        Order.user_id,
+        Order.guest_user_id,
+        Order.total_price,
+        # Legacy rows may hold a JSON string rather than an array; json_array_length would raise
+        case((func.json_typeof(Order.items) == "array", func.json_array_length(Order.items)), else_=0).label("item_count"),
+        Order.order_status,
+        Order.payment_method,
+        Order.payment_status,
+        Order.is_paid,
+        Order.reason,
+        Order.address,
+        Order.city,
+        Order.state,
+        Order.created_datetime,
+        Order.updated_datetime,
+    )
+
+
+def _fetch_orders(
+    db: Session,
+    filters: list,
+    view: OrderView,
+    order_ids: Optional[List[str]] = None,
+    newest_first: bool = False,
+) -> List[Union[OrderResponse, OrderSummaryResponse]]:
+    if view == OrderView.summary:
+        query = _order_summary_query(db).filter(*filters)
+    else:
+        query = db.query(Order).filter(*filters)
+        # Full detail (items JSON) is only loaded for the orders asked for
+        if order_ids:
+            query = query.filter(Order.id.in_(order_ids))
 
-    return order_responses
+    if newest_first:
+        query = query.order_by(Order.created_datetime.desc())
 
+    if view == OrderView.summary:
+        return [OrderSummaryResponse.model_validate(row._mapping) for row in query.all()]
+    return [_build_order_response(order) for order in query.all()]
 
 
-def get_orders_by_user_or_guest(request: OrderQueryRequest, db: Session) -> List[OrderResponse]:
+def get_orders_by_status_service(
+    status: OrderStatus,
+    db: Session,
+    view: OrderView = OrderView.full,
+    order_ids: Optional[List[str]] = None,
+) -> List[Union[OrderResponse, OrderSummaryResponse]]:
+    return _fetch_orders(db, [Order.order_status == status], view, order_ids)
+
+
+
+def _user_or_guest_filters(request: OrderQueryRequest) -> list:
     if not request.user_id and not request.guest_user_id:
         raise HTTPException(status_code=400, detail="Either user_id or guest_user_id must be provided.")
 
-    query = db.query(Order)
     if request.user_id:
-        query = query.filter(Order.user_id == request.user_id)
-    elif request.guest_user_id:
-        query = query.filter(Order.guest_user_id == request.guest_user_id)
+        return [Order.user_id == request.user_id]
+    return [Order.guest_user_id == request.guest_user_id]
+
 
-    orders = query.order_by(Order.created_datetime.desc()).all()
-    return [OrderResponse.from_orm(order) for order in orders]
+def get_orders_by_user_or_guest(
+    request: OrderQueryRequest,
+    db: Session,
+    view: OrderView = OrderView.full,
+    order_ids: Optional[List[str]] = None,
+) -> List[Union[OrderResponse, OrderSummaryResponse]]:
+    filters = _user_or_guest_filters(request)
+    return _fetch_orders(db, filters, view, order_ids, newest_first=True)
 
 def get_order_by_id(order_id: str, db: Session) -> OrderResponse:
     order = db.query(Order).filter(Order.id == order_id).first()
@@ -222,19 +317,13 @@ def get_order_by_id(order_id: str, db: Session) -> OrderResponse:
 )
 
 
-def get_orders_by_user_or_guest_service(request: OrderQueryRequest, db: Session) -> List[OrderResponse]:
-    if not request.user_id and not request.guest_user_id:
-        raise HTTPException(status_code=400, detail="Either user_id or guest_user_id must be provided.")
-
-    query = db.query(Order)
-    
-    if request.user_id:
-        query = query.filter(Order.user_id == request.user_id)
-    elif request.guest_user_id:
-        query = query.filter(Order.guest_user_id == request.guest_user_id)
-
-    orders = query.order_by(Order.created_datetime.desc()).all()
-    return [OrderResponse.from_orm(order) for order in orders]
+def get_orders_by_user_or_guest_service(
+    request: OrderQueryRequest,
+    db: Session,
+    view: OrderView = OrderView.full,
+    order_ids: Optional[List[str]] = None,
+) -> List[Union[OrderResponse, OrderSummaryResponse]]:
+    return get_orders_by_user_or_guest(request, db, view, order_ids)
 
 
 def update_order_reason(order_data: OrderReasonUpdate, db: Session):
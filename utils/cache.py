@@ -0,0 +1,76 @@
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Hashable, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries also expire after `ttl` seconds.
+    Keeps hit/miss counters so callers can expose them.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def remaining_ttl(self, key: Hashable) -> int:
+        with self._lock:
+            entry = self._data.get(key)
+            return max(0, int(entry[0] - time.monotonic())) if entry else 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+# Per-namespace write counters. Cache keys include the current version, so a
+# bump makes every older entry unreachable; they then age out of the LRU.
+_versions = defaultdict(int)
+_versions_lock = threading.Lock()
+
+
+def current_version(namespace: str) -> int:
+    with _versions_lock:
+        return _versions[namespace]
+
+
+def bump_version(namespace: str) -> int:
+    with _versions_lock:
+        _versions[namespace] += 1
+        return _versions[namespace]
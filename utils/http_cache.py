@@ -0,0 +1,88 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+from fastapi import Request, Response
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison against If-None-Match, as RFC 9110 asks for GET."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == bare:
+            return True
+    return False
+
+
+def cache_status(name: str, hit: bool, ttl: Optional[int] = None) -> str:
+    # RFC 9211 Cache-Status, e.g. `analytics; hit; ttl=42` or `analytics; fwd=miss`
+    value = f"{name}; hit" if hit else f"{name}; fwd=miss"
+    if ttl is not None:
+        value += f"; ttl={ttl}"
+    return value
+
+
+def not_modified(etag: str, headers: Optional[dict] = None) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, **(headers or {})})
+
+
+def http_date(value: datetime) -> str:
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def modified_since(request: Request, last_modified: datetime) -> bool:
+    """False only when If-Modified-Since is present, valid and not older than last_modified."""
+    header = request.headers.get("if-modified-since")
+    if not header:
+        return True
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return True
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have whole-second precision
+    return last_modified.replace(microsecond=0) > since
+
+
+def conditional_get(request: Request, response: Response, *validators) -> Optional[Response]:
+    """
+    Validates a GET from cheap validators (max(updated_datetime), row counts,
+    ids) before any rows are loaded. Returns the 304 to send, or None after
+    setting ETag / Last-Modified on `response` for the full answer.
+
+    The ETag also covers the path and query string, so each filter or page
+    validates separately. Last-Modified is the newest timestamp given; it
+    cannot see deletes, which is why If-None-Match takes precedence
+    (RFC 9110 13.2.2) and the ETag carries the counts.
+    """
+    stamps = [value for value in validators if isinstance(value, datetime)]
+    last_modified = max(stamps) if stamps else None
+    token = repr((request.url.path, request.url.query, validators)).encode()
+    etag = 'W/"' + hashlib.sha256(token).hexdigest()[:32] + '"'
+
+    headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+
+    if "if-none-match" in request.headers:
+        fresh = etag_matches(request, etag)
+    else:
+        fresh = last_modified is not None and not modified_since(request, last_modified)
+    if fresh:
+        return not_modified(etag, headers)
+
+    response.headers.update(headers)
+    return None
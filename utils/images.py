@@ -0,0 +1,53 @@
+"""
+Resized WebP/JPEG variants of an uploaded image.
+
+Runs inside the image process pool, so it only imports what rendering
+needs; Pillow is imported in the worker, not by the API process.
+"""
+import hashlib
+import os
+import re
+from typing import Dict
+
+# variant -> longest edge in pixels; images are never upscaled
+VARIANTS = {"thumb": 160, "card": 480, "full": 1600}
+FORMATS = {"webp": ("WEBP", {"quality": 80, "method": 4}), "jpeg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True})}
+# <slug>-<content hash>.<variant>.<format>; the hash makes the URL immutable
+VARIANT_NAME = re.compile(r"^[a-z0-9-]*-[0-9a-f]{16}\.(thumb|card|full)\.(webp|jpeg)$")
+
+
+def variant_stem(source: str) -> str:
+    """Readable base name for the variants of `source`, keyed by its content."""
+    name = os.path.splitext(os.path.basename(source))[0]
+    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")[:24] or "image"
+    with open(source, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+    return f"{slug}-{digest[:16]}"
+
+
+def render_variants(source: str, out_dir: str) -> Dict[str, Dict[str, str]]:
+    """Writes every variant of `source` into out_dir; returns {variant: {format: path}}."""
+    from PIL import Image, ImageOps
+
+    os.makedirs(out_dir, exist_ok=True)
+    stem = variant_stem(source)
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode != "RGB":
+            # JPEG has no alpha; flatten transparent screenshots onto white
+            rgba = image.convert("RGBA")
+            image = Image.new("RGB", rgba.size, (255, 255, 255))
+            image.paste(rgba, mask=rgba.getchannel("A"))
+
+        variants: Dict[str, Dict[str, str]] = {}
+        for variant, edge in VARIANTS.items():
+            resized = image.copy()
+            resized.thumbnail((edge, edge), Image.LANCZOS)
+            variants[variant] = {}
+            for ext, (pil_format, options) in FORMATS.items():
+                path = os.path.join(out_dir, f"{stem}.{variant}.{ext}")
+                partial = path + ".part"
+                resized.save(partial, pil_format, **options)
+                os.replace(partial, path)
+                variants[variant][ext] = path
+    return variants
@@ -0,0 +1,108 @@
+"""
+Postgres LISTEN/NOTIFY fan-out between worker processes.
+
+Each process runs one daemon thread holding a dedicated autocommit
+connection that LISTENs on every subscribed channel. `notify` publishes with
+pg_notify on a pooled connection. Payloads carry the sender's PROCESS_ID so
+a worker can skip its own messages.
+
+Notifications sent while the listener is disconnected are lost, so after
+every (re)connect each handler is called once with payload None and should
+treat it as "anything may have changed".
+"""
+from sqlalchemy import text
+from config.db.session import engine
+from typing import Callable, Dict, List, Optional
+import logging
+import select
+import threading
+import uuid
+
+logger = logging.getLogger(__name__)
+
+PROCESS_ID = uuid.uuid4().hex
+
+Handler = Callable[[Optional[str]], None]
+
+
+class PgListener:
+    def __init__(self, poll_seconds: float = 5.0, retry_seconds: float = 5.0):
+        self.poll_seconds = poll_seconds
+        self.retry_seconds = retry_seconds
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.connected = False
+        self.received = 0
+
+    def subscribe(self, channel: str, handler: Handler) -> None:
+        """Register before start(); handlers run on the listener thread."""
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="pg-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_seconds + 1)
+
+    def _dispatch(self, channel: str, payload: Optional[str]) -> None:
+        for handler in self._handlers.get(channel, []):
+            try:
+                handler(payload)
+            except Exception:
+                logger.exception(f"Handler for {channel} notification failed")
+
+    def _run(self) -> None:
+        cargs, cparams = engine.dialect.create_connect_args(engine.url)
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = engine.dialect.dbapi.connect(*cargs, **cparams)
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    for channel in self._handlers:
+                        cursor.execute(f'LISTEN "{channel}"')
+                self.connected = True
+                logger.info(f"Listening for notifications on {', '.join(self._handlers)}")
+                for channel in self._handlers:
+                    self._dispatch(channel, None)
+
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], self.poll_seconds) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notification = conn.notifies.pop(0)
+                        self.received += 1
+                        self._dispatch(notification.channel, notification.payload)
+            except Exception:
+                logger.exception(f"Notification listener lost its connection, retrying in {self.retry_seconds}s")
+                self._stop.wait(self.retry_seconds)
+            finally:
+                self.connected = False
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+    def stats(self) -> Dict:
+        return {"connected": self.connected, "channels": list(self._handlers), "received": self.received}
+
+
+listener = PgListener()
+
+
+def notify(channel: str, payload: str = PROCESS_ID) -> None:
+    """Publish on `channel`. Best effort: failures are logged, not raised."""
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": channel, "payload": payload})
+    except Exception:
+        logger.exception(f"Could not publish a notification on {channel}")
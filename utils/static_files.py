@@ -0,0 +1,102 @@
+"""
+StaticFiles for /uploads with cache-friendly headers.
+
+- Content-addressed names (`<sha256>.<ext>` from utils.storage, and image
+  variants carrying a content hash) never change content, so they are sent
+  with a year-long `immutable` Cache-Control and their file name as a strong
+  ETag. Other files must revalidate (mtime/size ETag from Starlette).
+- A request for a .jpg/.jpeg/.png is answered with the .webp sibling when
+  one exists and the client lists image/webp in Accept.
+- Text-like files are answered from a precompressed .br/.gz sibling when the
+  client accepts that encoding (written by utils.storage.precompress).
+
+Range requests are handled by Starlette's FileResponse.
+"""
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+from mimetypes import guess_type
+from typing import Optional
+from utils.images import VARIANT_NAME
+from utils.storage import is_compressible, is_stored_name
+import os
+import stat
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "public, no-cache"
+
+_WEBP_FALLBACKS = {".jpg", ".jpeg", ".png"}
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _accepts(header: Optional[str], token: str) -> bool:
+    """True if the comma-separated Accept / Accept-Encoding header lists `token` with q > 0."""
+    for part in (header or "").split(","):
+        value, *params = [piece.strip() for piece in part.split(";")]
+        if value.lower() != token:
+            continue
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    return float(param[2:]) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def _stat(path: str) -> Optional[os.stat_result]:
+    try:
+        result = os.stat(path)
+    except OSError:
+        return None
+    return result if stat.S_ISREG(result.st_mode) else None
+
+
+class UploadStaticFiles(StaticFiles):
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        full_path = str(full_path)
+        name = os.path.basename(full_path)
+        media_type = guess_type(name)[0] or "application/octet-stream"
+        headers = {}
+        vary = []
+
+        root, ext = os.path.splitext(full_path)
+        if ext.lower() in _WEBP_FALLBACKS:
+            vary.append("Accept")
+            webp_stat = _accepts(request_headers.get("accept"), "image/webp") and _stat(root + ".webp")
+            if webp_stat:
+                full_path, stat_result, media_type = root + ".webp", webp_stat, "image/webp"
+
+        if is_compressible(media_type):
+            vary.append("Accept-Encoding")
+            for encoding, suffix in _ENCODINGS:
+                encoded_stat = _accepts(request_headers.get("accept-encoding"), encoding) and _stat(full_path + suffix)
+                if encoded_stat:
+                    full_path, stat_result = full_path + suffix, encoded_stat
+                    headers["Content-Encoding"] = encoding
+                    break
+
+        if is_stored_name(name) or VARIANT_NAME.match(name):
+            headers["Cache-Control"] = IMMUTABLE
+            # The served file's name embeds its content hash (plus format/encoding suffix)
+            headers["ETag"] = f'"{os.path.basename(full_path)}"'
+        else:
+            headers["Cache-Control"] = REVALIDATE
+        if vary:
+            headers["Vary"] = ", ".join(vary)
+
+        response = FileResponse(
+            full_path, status_code=status_code, headers=headers, media_type=media_type, stat_result=stat_result
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
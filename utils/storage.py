@@ -0,0 +1,238 @@
+"""
+Upload storage.
+
+Uploads are streamed chunk by chunk into a temporary file while their
+SHA-256 is computed and their size checked, then stored under
+`<sha256><ext>`. Identical content therefore maps to one object, and two
+different files that share a client-side name no longer overwrite each
+other.
+
+`storage` is picked by STORAGE_BACKEND:
+
+    local  files under UPLOAD_DIR, served by the /uploads static mount;
+           references are the relative paths ("uploads/<sha256>.png")
+    s3     any S3-compatible bucket (S3_BUCKET, S3_ENDPOINT_URL, S3_PUBLIC_URL);
+           references are public URLs. Needs boto3.
+"""
+from abc import ABC, abstractmethod
+from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
+from typing import Iterator, Optional, Tuple
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import shutil
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_DIR = "uploads"
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "local")
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+CHUNK_BYTES = 256 * 1024
+
+_STORED_NAME = re.compile(r"^[0-9a-f]{64}(\.[a-z0-9]{1,5})?$")
+_COMPRESSIBLE = {"image/svg+xml", "application/json", "application/javascript", "application/xml"}
+
+
+def _extension(upload: UploadFile) -> str:
+    ext = mimetypes.guess_extension(upload.content_type or "") or os.path.splitext(upload.filename or "")[1]
+    ext = ext.lower()
+    return ext if re.fullmatch(r"\.[a-z0-9]{1,5}", ext) else ""
+
+
+def is_stored_name(name: str) -> bool:
+    """True for names this layer generates (<sha256><ext>)."""
+    return bool(_STORED_NAME.match(name))
+
+
+def is_compressible(media_type: Optional[str]) -> bool:
+    return bool(media_type) and (media_type.startswith("text/") or media_type in _COMPRESSIBLE)
+
+
+def precompress(path: str) -> Optional[str]:
+    """Writes a .gz sibling for text-like files; returns its path, or None if not worth it."""
+    if not is_compressible(mimetypes.guess_type(path)[0]):
+        return None
+    target = path + ".gz"
+    with open(path, "rb") as source, gzip.open(target + ".part", "wb", compresslevel=9) as out:
+        shutil.copyfileobj(source, out)
+    os.replace(target + ".part", target)
+    return target
+
+
+class Storage(ABC):
+    async def _spool(self, upload: UploadFile, max_bytes: int, directory: Optional[str] = None) -> Tuple[str, str]:
+        """Streams the upload into a temp file; returns (temp path, stored name)."""
+        digest = hashlib.sha256()
+        size = 0
+        fd, temp_path = tempfile.mkstemp(prefix=".upload-", suffix=".part", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while chunk := await upload.read(CHUNK_BYTES):
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"{upload.filename or 'Upload'} is larger than {max_bytes / (1024 * 1024):g} MB",
+                        )
+                    digest.update(chunk)
+                    await run_in_threadpool(out.write, chunk)
+            if size == 0:
+                raise HTTPException(status_code=400, detail=f"{upload.filename or 'Upload'} is empty")
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return temp_path, digest.hexdigest() + _extension(upload)
+
+    @abstractmethod
+    async def save(self, upload: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> str:
+        """Stores the upload (or finds identical content) and returns its reference."""
+
+    @abstractmethod
+    def exists(self, ref: str) -> bool:
+        ...
+
+    @abstractmethod
+    def delete(self, ref: str) -> None:
+        ...
+
+    @abstractmethod
+    def modified(self, ref: str) -> Optional[float]:
+        """Last modified epoch seconds of the object, or None if it no longer exists."""
+
+    @abstractmethod
+    def list(self) -> Iterator[Tuple[str, int, float]]:
+        """(reference, size in bytes, last modified epoch seconds) of every stored object."""
+
+
+class LocalStorage(Storage):
+    def __init__(self, directory: str = UPLOAD_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _ref(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    async def save(self, upload: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> str:
+        # Spool inside the upload directory so the final rename never crosses filesystems
+        temp_path, name = await self._spool(upload, max_bytes, self.directory)
+        ref = self._ref(name)
+        if os.path.exists(ref):
+            os.unlink(temp_path)
+            # Fresh mtime keeps the orphan collector's grace period off a file that is in use again
+            os.utime(ref)
+            logger.info(f"Upload {upload.filename} matches existing {ref}")
+        else:
+            os.replace(temp_path, ref)
+            # Lets the /uploads mount answer Accept-Encoding: gzip (e.g. SVGs)
+            await run_in_threadpool(precompress, ref)
+        return ref
+
+    def exists(self, ref: str) -> bool:
+        return os.path.isfile(ref)
+
+    def delete(self, ref: str) -> None:
+        try:
+            os.unlink(ref)
+        except FileNotFoundError:
+            pass
+
+    def modified(self, ref: str) -> Optional[float]:
+        try:
+            return os.stat(ref).st_mtime
+        except FileNotFoundError:
+            return None
+
+    def list(self) -> Iterator[Tuple[str, int, float]]:
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    info = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, info.st_size, info.st_mtime
+
+
+class S3Storage(Storage):
+    def __init__(self, bucket: str, endpoint_url: Optional[str] = None, public_url: Optional[str] = None, prefix: str = "uploads/"):
+        import boto3
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = boto3.client("s3", endpoint_url=endpoint_url)
+        self.public_url = (public_url or f"{endpoint_url or 'https://s3.amazonaws.com'}/{bucket}").rstrip("/")
+
+    def _key(self, ref: str) -> str:
+        return ref[len(self.public_url) + 1:] if ref.startswith(self.public_url + "/") else ref
+
+    def _head(self, key: str) -> Optional[dict]:
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=key)
+        except self.client.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def _touch(self, key: str, head: dict) -> None:
+        # S3 has no utime; an in-place copy that replaces the metadata rewrites LastModified
+        self.client.copy_object(
+            Bucket=self.bucket, Key=key, CopySource={"Bucket": self.bucket, "Key": key},
+            MetadataDirective="REPLACE",
+            ContentType=head.get("ContentType") or "application/octet-stream",
+            Metadata=head.get("Metadata") or {},
+        )
+
+    def _exists_key(self, key: str) -> bool:
+        return self._head(key) is not None
+
+    async def save(self, upload: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> str:
+        temp_path, name = await self._spool(upload, max_bytes)
+        key = self.prefix + name
+        try:
+            head = await run_in_threadpool(self._head, key)
+            if head is None:
+                await run_in_threadpool(
+                    self.client.upload_file, temp_path, self.bucket, key,
+                    ExtraArgs={"ContentType": upload.content_type or "application/octet-stream"},
+                )
+            else:
+                # Fresh LastModified keeps the orphan collector's grace period off an object in use again
+                await run_in_threadpool(self._touch, key, head)
+                logger.info(f"Upload {upload.filename} matches existing {key}")
+        finally:
+            os.unlink(temp_path)
+        return f"{self.public_url}/{key}"
+
+    def exists(self, ref: str) -> bool:
+        return self._exists_key(self._key(ref))
+
+    def delete(self, ref: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(ref))
+
+    def modified(self, ref: str) -> Optional[float]:
+        head = self._head(self._key(ref))
+        return head["LastModified"].timestamp() if head else None
+
+    def list(self) -> Iterator[Tuple[str, int, float]]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for obj in page.get("Contents", []):
+                yield f"{self.public_url}/{obj['Key']}", obj["Size"], obj["LastModified"].timestamp()
+
+
+def _make_storage() -> Storage:
+    if STORAGE_BACKEND == "s3":
+        return S3Storage(
+            bucket=os.environ["S3_BUCKET"],
+            endpoint_url=os.getenv("S3_ENDPOINT_URL"),
+            public_url=os.getenv("S3_PUBLIC_URL"),
+        )
+    return LocalStorage(UPLOAD_DIR)
+
+
+storage = _make_storage()